@@ -10,22 +10,34 @@ It imports and runs the new enterprise-structured agent entrypoint.
 # The Google GenAI SDK reads GOOGLE_API_KEY when modules are imported
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Dict, Optional
+from dotenv import dotenv_values
+
+# Parsed .env.local values, cached so the file is read at most once per process
+_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _load_env_file(path: Path) -> Dict[str, Optional[str]]:
+    """Parse the env file once and return the cached values"""
+    if not _CACHE:
+        _CACHE.update(dotenv_values(path))
+    return _CACHE
+
 
 # Load .env.local from project root (parent directory)
+# Skipped entirely when the key is already in the environment (e.g. set by the container)
 env_path = Path(__file__).parent.parent / ".env.local"
-if env_path.exists():
-    load_dotenv(env_path, override=True)
+if not os.environ.get("GOOGLE_API_KEY") and env_path.exists():
+    # Only fill in variables that are not already set in the process environment
+    for key, value in _load_env_file(env_path).items():
+        if value is not None and not os.environ.get(key):
+            os.environ[key] = value
+    
     # Immediately set Google API key in environment
-    google_api_key = os.getenv("GOOGLE_API_KEY")
-    if google_api_key:
-        google_api_key = google_api_key.strip()
-        if google_api_key:
-            os.environ["GOOGLE_API_KEY"] = google_api_key
-        else:
-            raise RuntimeError("GOOGLE_API_KEY is empty in .env.local")
-    else:
-        raise RuntimeError("GOOGLE_API_KEY not found in .env.local - required at startup")
+    google_api_key = (os.environ.get("GOOGLE_API_KEY") or "").strip()
+    if not google_api_key:
+        raise RuntimeError("GOOGLE_API_KEY not found or empty in .env.local - required at startup")
+    os.environ["GOOGLE_API_KEY"] = google_api_key
 
 # NOW import other modules (after environment is set)
 from app.agents.entrypoint import entrypoint
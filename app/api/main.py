@@ -4,37 +4,193 @@ FastAPI Application
 HTTP API server for application upload and interview scheduling.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
-from typing import Optional
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException, status
+from typing import AsyncIterator, Optional, Tuple
+from fastapi import BackgroundTasks, FastAPI, File, UploadFile, Form, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, EmailStr
+from starlette.types import ASGIApp, Receive, Scope, Send
 import asyncio
-import random
-import json
+import asyncpg
+import dataclasses
+import hashlib
+import httpx
+import logging
+import multiprocessing
+import orjson
+import secrets
 
 from livekit import api as livekit_api
 
 from app.config import Config, get_config
-from app.services.resume_service import ResumeService
+from app.services.resume_service import ResumeService, extract_text_bytes
 from app.services.booking_service import BookingService
 from app.services.email_service import EmailService
-from app.utils.logger import get_logger
+from app.utils.exceptions import ValidationError
+from app.utils.logger import get_logger, setup_logging
 
 logger = get_logger(__name__)
 config = get_config()
 
+# Uploads are processed in fixed-size chunks instead of being read whole
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Largest accepted upload request body: the file size limit plus room for multipart headers
+MAX_UPLOAD_BODY_SIZE = ResumeService.MAX_FILE_SIZE + 64 * 1024
+
+# Timezone assumed for scheduled times sent without an offset
+IST = timezone(timedelta(hours=5, minutes=30))
+
+# Participant token settings shared by every interview; only the room varies per request
+PARTICIPANT_TOKEN_TTL = timedelta(minutes=15)
+PARTICIPANT_GRANTS = livekit_api.VideoGrants(
+    room_join=True,
+    can_publish=True,
+    can_publish_data=True,
+    can_subscribe=True,
+)
+
+
+def _create_extract_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Create a process pool for resume text extraction"""
+    return ProcessPoolExecutor(
+        max_workers=max_workers or config.server.extract_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+async def _extract_text_in_pool(
+    file_content: bytes,
+    filename: str,
+    content_type: Optional[str],
+) -> Tuple[str, Optional[str]]:
+    """
+    Extract resume text in the process pool.
+    
+    A worker that dies (crash or OOM kill) breaks the whole executor, so a broken
+    pool is replaced with a fresh one. The extraction is then retried once in a
+    single-use process, so a file that crashes its worker again cannot break
+    the new shared pool.
+    
+    Args:
+        file_content: File content as bytes
+        filename: Original filename
+        content_type: MIME type of file
+        
+    Returns:
+        Tuple of (extracted_text, error_message)
+        
+    Raises:
+        BrokenProcessPool: If the retry crashes its worker as well
+    """
+    loop = asyncio.get_running_loop()
+    pool = app.state.extract_pool
+    try:
+        return await loop.run_in_executor(pool, extract_text_bytes, file_content, filename, content_type)
+    except BrokenProcessPool:
+        # Concurrent requests see the same broken pool; only the first one replaces it
+        if app.state.extract_pool is pool:
+            logger.warning("[API] ⚠️ Extraction process pool is broken - starting a new one")
+            app.state.extract_pool = _create_extract_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    retry_pool = _create_extract_pool(max_workers=1)
+    try:
+        return await loop.run_in_executor(retry_pool, extract_text_bytes, file_content, filename, content_type)
+    finally:
+        retry_pool.shutdown(wait=False)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown"""
+    # Configure logging in each worker process (uvicorn only sets up its own loggers)
+    setup_logging(config)
+    # Text extraction is CPU-bound, so it runs in worker processes to keep the event loop free.
+    # Workers are spawned rather than forked from the running event loop process.
+    app.state.extract_pool = _create_extract_pool()
+    # One pooled HTTP client for Supabase requests, so TLS connections are reused across requests
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=30.0,
+    )
+    app.state.http = http_client
+    booking_service.http_client = http_client
+    # Pooled Postgres connections for bookings; without a database URL bookings use the REST API
+    if config.supabase.db_url:
+        booking_service.db_pool = await asyncpg.create_pool(
+            dsn=config.supabase.db_url,
+            min_size=config.supabase.db_pool_min_size,
+            max_size=config.supabase.db_pool_max_size,
+            max_inactive_connection_lifetime=300,
+            command_timeout=60,
+            statement_cache_size=config.supabase.db_statement_cache_size,
+        )
+    try:
+        yield
+    finally:
+        if booking_service.db_pool is not None:
+            await booking_service.db_pool.close()
+            booking_service.db_pool = None
+        booking_service.http_client = None
+        await http_client.aclose()
+        await email_service.close()
+        app.state.extract_pool.shutdown(wait=False, cancel_futures=True)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Interview Scheduling API",
     description="API for application upload and interview scheduling",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized uploads from their Content-Length before the body is read.
+    
+    Pure ASGI middleware: requests to other paths pass straight through
+    without being wrapped.
+    """
+    
+    def __init__(self, app: ASGIApp, path: str, max_body_size: int):
+        self.app = app
+        self.path = path
+        self.max_body_size = max_body_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == self.path:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        response = ORJSONResponse(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            content={"detail": f"File size exceeds maximum of {ResumeService.MAX_FILE_SIZE / 1024 / 1024}MB"},
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+# Registered before CORS so the rejection still carries CORS headers
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    path="/api/upload-application",
+    max_body_size=MAX_UPLOAD_BODY_SIZE,
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify allowed origins
+    allow_origins=config.server.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -65,7 +221,8 @@ class UploadApplicationResponse(BaseModel):
 class ScheduleInterviewResponse(BaseModel):
     ok: bool
     interviewUrl: str
-    emailSent: bool = False
+    emailSent: bool = False  # True once the email is queued for delivery
+    emailStatus: Optional[str] = None
     emailError: Optional[str] = None
 
 
@@ -74,10 +231,11 @@ class BookingResponse(BaseModel):
     name: str
     email: str
     phone: str
-    scheduled_at: str
-    created_at: str
+    scheduled_at: datetime
+    created_at: datetime
     resume_text: Optional[str] = None
     resume_url: Optional[str] = None
+    email_status: Optional[str] = None
 
 
 class ConnectionDetailsRequest(BaseModel):
@@ -92,6 +250,63 @@ class ConnectionDetailsResponse(BaseModel):
     participantToken: str
 
 
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Read an uploaded file in chunks from its current position"""
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+async def _send_interview_email_task(
+    token: str,
+    to_email: str,
+    name: str,
+    interview_url: str,
+    scheduled_at: datetime,
+) -> None:
+    """Send interview email after the response and record the outcome on the booking"""
+    email_sent, email_error = await email_service.send_interview_email(
+        to_email=to_email,
+        name=name,
+        interview_url=interview_url,
+        scheduled_at=scheduled_at,
+    )
+    if not email_sent:
+        logger.warning(f"[API] Email sending failed: {email_error}")
+    
+    await booking_service.update_email_status(token, "sent" if email_sent else "failed")
+
+
+def _log_token_room_config(participant_token: str, agent_name: Optional[str]) -> None:
+    """Log whether the agent dispatch RoomConfiguration made it into the participant JWT"""
+    try:
+        import jwt
+        decoded = jwt.decode(participant_token, options={"verify_signature": False})
+        # LiveKit uses 'roomConfig' (camelCase) in JWT, not 'room_config'
+        if "roomConfig" in decoded:
+            room_config_data = decoded.get('roomConfig', {})
+            logger.info("[API] ✅ Token verification: RoomConfiguration encoded in JWT: %s", room_config_data)
+            
+            # Verify agent name is in roomConfig
+            if isinstance(room_config_data, dict):
+                agents = room_config_data.get('agents', [])
+                if agents and len(agents) > 0:
+                    agent_name_in_token = agents[0].get('agentName', '')
+                    if agent_name_in_token != agent_name:
+                        logger.warning(
+                            "[API]   ⚠️  Agent name mismatch in token! Expected: '%s', Got: '%s'",
+                            agent_name, agent_name_in_token,
+                        )
+        elif "grants" in decoded:
+            logger.info("[API] ✅ Token has grants (RoomConfiguration may be in grants)")
+        else:
+            logger.warning(
+                "[API] ⚠️  Token verification: RoomConfiguration may not be in JWT (keys: %s)",
+                list(decoded.keys()),
+            )
+    except Exception as e:
+        logger.warning("[API] Could not decode token for verification: %s", e)
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -108,22 +323,29 @@ async def upload_application(file: UploadFile = File(...)):
     try:
         logger.info(f"[API] Received application upload: {file.filename} ({file.content_type})")
         
-        # Read file content
-        file_content = await file.read()
-        
-        # Validate file
-        is_valid, error_msg = resume_service.validate_file(
-            file_content, file.filename, file.content_type
-        )
-        if not is_valid:
+        # Validate and hash file while reading it from the upload's own spooled
+        # temporary file (Starlette keeps small uploads in memory and larger ones on disk)
+        content_hash = hashlib.blake2b(digest_size=32)
+        file_size = 0
+        try:
+            async for chunk in resume_service.validate_stream(
+                _iter_upload(file), file.filename, file.content_type
+            ):
+                content_hash.update(chunk)
+                file_size += len(chunk)
+        except ValidationError as e:
+            # 400, or 413 for files over the size limit (same status as the Content-Length check)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error_msg
+                status_code=e.status_code,
+                detail=e.message
             )
         
         # Upload to Supabase Storage
         try:
-            resume_url = booking_service.upload_resume_to_storage(file_content, file.filename)
+            await file.seek(0)
+            resume_url = await booking_service.upload_resume_to_storage_stream(
+                _iter_upload(file), file.filename, file_size
+            )
         except Exception as e:
             logger.error(f"[API] Failed to upload to storage: {str(e)}")
             raise HTTPException(
@@ -131,10 +353,27 @@ async def upload_application(file: UploadFile = File(...)):
                 detail=f"Failed to upload application: {str(e)}"
             )
         
-        # Extract text
-        resume_text, extraction_error = resume_service.extract_text(
-            file_content, file.filename, file.content_type
-        )
+        # Reuse the extraction result if the same file was uploaded before
+        content_digest = content_hash.hexdigest()
+        cached_extraction = resume_service.get_cached_extraction(content_digest, file.filename)
+        
+        if cached_extraction is not None:
+            resume_text, extraction_error = cached_extraction
+            logger.info(f"[API] Reusing cached text extraction for {file.filename}")
+        else:
+            # Extract text in the process pool (workers receive the content as bytes)
+            try:
+                await file.seek(0)
+                file_content = await file.read()
+                resume_text, extraction_error = await _extract_text_in_pool(
+                    file_content, file.filename, file.content_type
+                )
+                resume_service.cache_extraction(
+                    content_digest, file.filename, (resume_text, extraction_error)
+                )
+            except Exception as e:
+                logger.error(f"[API] Text extraction worker failed: {str(e)}", exc_info=True)
+                resume_text, extraction_error = "", f"Failed to extract text: {str(e)}"
         
         if resume_text:
             logger.info(f"[API] ✅ Application processed: {len(resume_text)} characters extracted")
@@ -159,11 +398,12 @@ async def upload_application(file: UploadFile = File(...)):
 
 
 @app.post("/api/schedule-interview", response_model=ScheduleInterviewResponse)
-async def schedule_interview(request: ScheduleInterviewRequest):
+async def schedule_interview(request: ScheduleInterviewRequest, background_tasks: BackgroundTasks):
     """
     Schedule an interview.
     
-    Creates a booking in the database and sends confirmation email.
+    Creates a booking in the database and queues the confirmation email,
+    which is sent after the response is returned.
     """
     try:
         logger.info(f"[API] Received schedule request: {request.email} at {request.datetime}")
@@ -176,35 +416,23 @@ async def schedule_interview(request: ScheduleInterviewRequest):
             )
         
         # Parse datetime
+        # Times without timezone info are treated as IST and converted to UTC
         try:
-            # Try parsing with timezone info first
-            if 'Z' in request.datetime or '+' in request.datetime or request.datetime.count('-') > 2:
-                # Has timezone info
-                scheduled_at = datetime.fromisoformat(request.datetime.replace('Z', '+00:00'))
-            else:
-                # No timezone info - treat as local time and convert to UTC
-                naive_dt = datetime.fromisoformat(request.datetime)
-                # Assume it's in IST (UTC+5:30) if no timezone specified
-                # Convert to UTC for storage
-                ist_offset = timezone(timedelta(hours=5, minutes=30))
-                scheduled_at = naive_dt.replace(tzinfo=ist_offset).astimezone(timezone.utc)
+            datetime_str = request.datetime
+            if datetime_str.endswith('Z'):
+                datetime_str = datetime_str[:-1] + '+00:00'
+            scheduled_at = datetime.fromisoformat(datetime_str)
+            if scheduled_at.tzinfo is None:
+                scheduled_at = scheduled_at.replace(tzinfo=IST).astimezone(timezone.utc)
         except ValueError:
-            try:
-                # Fallback: try parsing as-is
-                scheduled_at = datetime.fromisoformat(request.datetime)
-                # If still naive, assume IST and convert to UTC
-                if scheduled_at.tzinfo is None:
-                    ist_offset = timezone(timedelta(hours=5, minutes=30))
-                    scheduled_at = scheduled_at.replace(tzinfo=ist_offset).astimezone(timezone.utc)
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid datetime format. Expected ISO format."
-                )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid datetime format. Expected ISO format."
+            )
         
         # Create booking
         try:
-            token = booking_service.create_booking(
+            token = await booking_service.create_booking(
                 name=request.name,
                 email=request.email,
                 phone=request.phone,
@@ -223,20 +451,25 @@ async def schedule_interview(request: ScheduleInterviewRequest):
         base_url = config.server.frontend_url.rstrip('/')
         interview_url = f"{base_url}/interview/{token}"
         
-        # Send email (non-blocking)
+        # Queue email to be sent after the response
         email_sent = False
+        email_status = None
         email_error = None
         
-        try:
-            email_sent, email_error = await email_service.send_interview_email(
+        if email_service.enabled:
+            background_tasks.add_task(
+                _send_interview_email_task,
+                token=token,
                 to_email=request.email,
                 name=request.name,
                 interview_url=interview_url,
                 scheduled_at=scheduled_at,
             )
-        except Exception as e:
-            email_error = str(e)
-            logger.warning(f"[API] Email sending failed: {email_error}")
+            email_sent = True
+            email_status = "queued"
+        else:
+            email_error = "Email service not configured"
+            logger.warning("[API] SMTP not configured - skipping email send")
         
         logger.info(f"[API] ✅ Interview scheduled: {interview_url}")
         
@@ -244,6 +477,7 @@ async def schedule_interview(request: ScheduleInterviewRequest):
             ok=True,
             interviewUrl=interview_url,
             emailSent=email_sent,
+            emailStatus=email_status,
             emailError=email_error,
         )
         
@@ -264,7 +498,7 @@ async def get_booking(token: str):
     Get booking details by token.
     """
     try:
-        booking = booking_service.get_booking(token)
+        booking = await booking_service.get_booking(token)
         
         if not booking:
             raise HTTPException(
@@ -272,7 +506,9 @@ async def get_booking(token: str):
                 detail="Booking not found"
             )
         
-        return BookingResponse(**booking)
+        # Cached bookings leave out email_status, since it changes after the booking is created
+        email_status = await booking_service.get_email_status(token)
+        return BookingResponse(**booking, email_status=email_status)
         
     except HTTPException:
         raise
@@ -311,48 +547,46 @@ async def connection_details(request: ConnectionDetailsRequest):
             )
         
         # Extract agent name from request
-        print(f"[API] 📥 Received connection-details request:")
-        print(f"[API]   room_config: {request.room_config}")
-        print(f"[API]   token: {request.token if request.token else 'None'}")
-        logger.info(f"[API] 📥 Received connection-details request:")
-        logger.info(f"   room_config: {request.room_config}")
-        logger.info(f"   token: {request.token if request.token else 'None'}")
+        logger.info(
+            "[API] 📥 Received connection-details request: room_config=%s token=%s",
+            request.room_config, request.token,
+        )
         
         agent_name = None
         if request.room_config and isinstance(request.room_config, dict):
             agents = request.room_config.get("agents", [])
-            logger.info(f"   Found agents array: {agents}")
             if agents and len(agents) > 0:
                 agent_name = agents[0].get("agent_name")
-                logger.info(f"   Extracted agent_name from request: '{agent_name}'")
         
         # Use default agent name from config if not provided
         if not agent_name:
             agent_name = config.livekit.agent_name
-            logger.info(f"   Using default agent_name from config: '{agent_name}'")
+            logger.info("[API] Using default agent_name from config: '%s'", agent_name)
         else:
-            logger.info(f"   ✅ Using agent_name: '{agent_name}'")
+            logger.info("[API] ✅ Using agent_name from request: '%s'", agent_name)
         
         # If token is provided, fetch booking to get resume text
         resume_text = None
         if request.token:
             try:
-                booking = booking_service.get_booking(request.token)
+                booking = await booking_service.get_booking(request.token)
                 if booking and booking.get("resume_text"):
                     resume_text = booking["resume_text"]
-                    logger.info(f"[API] Found resume text for token {request.token} ({len(resume_text)} chars)")
+                    logger.info("[API] Found resume text for token %s (%d chars)", request.token, len(resume_text))
             except Exception as e:
-                logger.warning(f"[API] Failed to fetch booking for resume: {e}")
+                logger.warning("[API] Failed to fetch booking for resume: %s", e)
         
         # Generate room details
         participant_name = "user"
-        participant_identity = f"voice_assistant_user_{random.randint(1, 99999)}"
-        room_name = f"voice_assistant_room_{random.randint(1, 99999)}"
+        participant_identity = f"voice_assistant_user_{secrets.token_urlsafe(8)}"
+        room_name = f"voice_assistant_room_{secrets.token_urlsafe(8)}"
         
         # Create room metadata with resume text (if available)
+        # The metadata is embedded in the participant JWT, so only send the part
+        # of the resume the agent uses (it truncates to MAX_RESUME_LENGTH as well)
         room_metadata = None
         if resume_text:
-            room_metadata = json.dumps({"resume_text": resume_text})
+            room_metadata = orjson.dumps({"resume_text": resume_text[:config.MAX_RESUME_LENGTH]}).decode()
         
         # Create LiveKit AccessToken
         token = livekit_api.AccessToken(
@@ -361,95 +595,44 @@ async def connection_details(request: ConnectionDetailsRequest):
         )
         token.with_identity(participant_identity)
         token.with_name(participant_name)
-        token.with_ttl(timedelta(minutes=15))
+        token.with_ttl(PARTICIPANT_TOKEN_TTL)
         
         # Add video grant (permissions)
-        grant = livekit_api.VideoGrants(
-            room=room_name,
-            room_join=True,
-            can_publish=True,
-            can_publish_data=True,
-            can_subscribe=True,
-        )
-        token.with_grants(grant)
+        token.with_grants(dataclasses.replace(PARTICIPANT_GRANTS, room=room_name))
         
         # Set room configuration with agent
         if agent_name:
-            print(f"[API] 🔧 Creating RoomConfiguration with agent dispatch:")
-            print(f"[API] Agent Name: '{agent_name}'")
-            logger.info(f"[API] 🔧 Creating RoomConfiguration with agent dispatch:")
-            logger.info(f"   Agent Name: '{agent_name}'")
             room_config = livekit_api.RoomConfiguration()
             room_agent_dispatch = room_config.agents.add()
             room_agent_dispatch.agent_name = agent_name
-            print(f"[API] RoomConfiguration created with agent: '{room_agent_dispatch.agent_name}'")
             
             # Verify agent name matches what worker expects
             expected_agent_name = config.livekit.agent_name
             if agent_name != expected_agent_name:
-                logger.warning(f"[API] ⚠️  Agent name mismatch! Request: '{agent_name}' vs Config: '{expected_agent_name}'")
-                print(f"[API] ⚠️  Agent name mismatch! Request: '{agent_name}' vs Config: '{expected_agent_name}'")
-            else:
-                logger.info(f"[API] ✅ Agent name verified: '{agent_name}' matches config")
-                print(f"[API] ✅ Agent name verified: '{agent_name}' matches config")
+                logger.warning(
+                    "[API] ⚠️  Agent name mismatch! Request: '%s' vs Config: '%s'",
+                    agent_name, expected_agent_name,
+                )
             
             if room_metadata:
                 room_config.metadata = room_metadata
-                logger.info(f"   Room metadata: {room_metadata[:100]}...")
             token.with_room_config(room_config)
-            print(f"[API] ✅ RoomConfiguration attached to token")
-            logger.info(f"[API] ✅ RoomConfiguration set with agent dispatch")
+            logger.info("[API] ✅ RoomConfiguration set with agent dispatch: '%s'", agent_name)
         else:
-            print(f"[API] ⚠️  No agent_name provided - agent will NOT be dispatched!")
-            logger.warning(f"[API] ⚠️  No agent_name provided - agent will NOT be dispatched!")
+            logger.warning("[API] ⚠️  No agent_name provided - agent will NOT be dispatched!")
         
         # Generate JWT token
         participant_token = token.to_jwt()
         
         # Debug: Verify RoomConfiguration is in token (for deployment debugging)
-        try:
-            import jwt
-            decoded = jwt.decode(participant_token, options={"verify_signature": False})
-            # LiveKit uses 'roomConfig' (camelCase) in JWT, not 'room_config'
-            if "roomConfig" in decoded:
-                logger.info(f"[API] ✅ Token verification: RoomConfiguration encoded in JWT")
-                print(f"[API] ✅ Token verification: RoomConfiguration encoded in JWT")
-                room_config_data = decoded.get('roomConfig', {})
-                logger.info(f"[API]   roomConfig in token: {room_config_data}")
-                print(f"[API]   roomConfig in token: {room_config_data}")
-                
-                # Verify agent name is in roomConfig
-                if isinstance(room_config_data, dict):
-                    agents = room_config_data.get('agents', [])
-                    if agents and len(agents) > 0:
-                        agent_name_in_token = agents[0].get('agentName', '')
-                        logger.info(f"[API]   ✅ Agent name in token: '{agent_name_in_token}'")
-                        print(f"[API]   ✅ Agent name in token: '{agent_name_in_token}'")
-                        if agent_name_in_token != agent_name:
-                            logger.warning(f"[API]   ⚠️  Agent name mismatch in token! Expected: '{agent_name}', Got: '{agent_name_in_token}'")
-                            print(f"[API]   ⚠️  Agent name mismatch in token! Expected: '{agent_name}', Got: '{agent_name_in_token}'")
-            elif "grants" in decoded:
-                logger.info(f"[API] ✅ Token has grants (RoomConfiguration may be in grants)")
-                print(f"[API] ✅ Token has grants (RoomConfiguration may be in grants)")
-            else:
-                logger.warning(f"[API] ⚠️  Token verification: RoomConfiguration may not be in JWT")
-                print(f"[API] ⚠️  Token verification: RoomConfiguration may not be in JWT")
-                print(f"[API]   Token keys: {list(decoded.keys())}")
-        except Exception as e:
-            logger.warning(f"[API] Could not decode token for verification: {e}")
-        
-        print(f"[API] ✅ Generated connection details:")
-        print(f"[API]   Server URL: {config.livekit.url}")
-        print(f"[API]   Room Name: {room_name}")
-        print(f"[API]   Participant Name: {participant_name}")
-        print(f"[API]   Agent Name: {agent_name}")
-        print(f"[API]   Token Length: {len(participant_token)} chars")
-        logger.info(f"[API] ✅ Generated connection details:")
-        logger.info(f"   Server URL: {config.livekit.url}")
-        logger.info(f"   Room Name: {room_name}")
-        logger.info(f"   Participant Name: {participant_name}")
-        logger.info(f"   Agent Name: {agent_name}")
-        logger.info(f"   Token Length: {len(participant_token)} chars")
+        # Skipped entirely when INFO logging is disabled, since decoding the token is not free
+        if logger.isEnabledFor(logging.INFO):
+            _log_token_room_config(participant_token, agent_name)
+        
+        logger.info(
+            "[API] ✅ Generated connection details: server_url=%s room=%s participant=%s agent=%s token_length=%d",
+            config.livekit.url, room_name, participant_name, agent_name, len(participant_token),
+        )
         
         return ConnectionDetailsResponse(
             serverUrl=config.livekit.url,
@@ -6,8 +6,8 @@ with proper validation and type safety.
 """
 
 import os
-from typing import Optional
-from dataclasses import dataclass
+from typing import List, Optional
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -86,6 +86,10 @@ class SupabaseConfig:
     """Supabase configuration"""
     url: str
     service_role_key: str
+    db_url: Optional[str] = None  # Direct Postgres connection string (enables asyncpg pool)
+    db_pool_min_size: int = 1  # Per API worker process
+    db_pool_max_size: int = 10  # Per API worker process
+    db_statement_cache_size: int = 1024  # 0 disables prepared statements (required behind a transaction-mode pooler)
 
 
 @dataclass
@@ -106,6 +110,9 @@ class ServerConfig:
     host: str = "0.0.0.0"
     port: int = 8000
     frontend_url: str = "http://localhost:3000"
+    cors_origins: List[str] = field(default_factory=list)  # Exact origins allowed by CORS
+    workers: int = 2  # API worker processes
+    extract_workers: int = 1  # Text extraction processes per API worker
 
 
 @dataclass
@@ -200,6 +207,19 @@ class Config:
         if not supabase_key:
             raise ValueError("SUPABASE_SERVICE_ROLE_KEY environment variable is required")
         
+        # CORS origins (optional) - defaults to the frontend URL
+        # Origins are normalized without a trailing slash so they match the browser's Origin header exactly
+        frontend_url = os.getenv("NEXT_PUBLIC_APP_URL") or os.getenv("FRONTEND_URL", "http://localhost:3000")
+        cors_origins = [
+            origin.strip().rstrip('/')
+            for origin in os.getenv("CORS_ALLOWED_ORIGINS", frontend_url).split(",")
+            if origin.strip()
+        ]
+        
+        # API worker processes share the available CPUs for text extraction
+        workers = max(1, int(os.getenv("WEB_CONCURRENCY", "2")))
+        extract_workers = int(os.getenv("EXTRACT_WORKERS", "0")) or max(1, available_cpus() // workers)
+        
         # SMTP configuration (optional)
         smtp_port = os.getenv("SMTP_PORT", "587")
         smtp_secure = os.getenv("SMTP_SECURE", "false").lower() == "true" or smtp_port == "465"
@@ -239,6 +259,10 @@ class Config:
             supabase=SupabaseConfig(
                 url=supabase_url,
                 service_role_key=supabase_key,
+                db_url=os.getenv("SUPABASE_DB_URL"),
+                db_pool_min_size=int(os.getenv("SUPABASE_DB_POOL_MIN_SIZE", "1")),
+                db_pool_max_size=int(os.getenv("SUPABASE_DB_POOL_MAX_SIZE", "10")),
+                db_statement_cache_size=int(os.getenv("SUPABASE_DB_STATEMENT_CACHE_SIZE", "1024")),
             ),
             smtp=SMTPConfig(
                 host=os.getenv("SMTP_HOST"),
@@ -252,7 +276,10 @@ class Config:
             server=ServerConfig(
                 host=os.getenv("SERVER_HOST", "0.0.0.0"),
                 port=int(os.getenv("SERVER_PORT", "8000")),
-                frontend_url=os.getenv("NEXT_PUBLIC_APP_URL") or os.getenv("FRONTEND_URL", "http://localhost:3000"),
+                frontend_url=frontend_url,
+                cors_origins=cors_origins,
+                workers=workers,
+                extract_workers=extract_workers,
             ),
             MAX_RESUME_LENGTH=int(os.getenv("MAX_RESUME_LENGTH", "3000")),
             ENABLE_ML_TURN_DETECTION=os.getenv("ENABLE_ML_TURN_DETECTION", "false").lower() == "true",
@@ -261,6 +288,31 @@ class Config:
 
 
 
+def available_cpus() -> int:
+    """
+    Get the number of CPUs this process may use.
+    
+    Honors the cgroup v2 CPU quota and the CPU affinity mask, since
+    os.cpu_count() reports the host's CPUs inside containers.
+    
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = min(cpus, int(quota) // int(period))
+    except (OSError, ValueError):
+        pass
+    
+    return max(1, cpus)
+
+
 def get_config() -> Config:
     """
     Get configuration from environment variables.
@@ -4,9 +4,18 @@ Booking Service
 Handles interview booking operations with Supabase.
 """
 
+import asyncio
+import random
 import secrets
+import string
+import time
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import AsyncIterable, Optional, Dict, Any
+
+import asyncpg
+import httpx
+from cachetools import TTLCache
 from supabase import create_client, Client
 from app.config import Config
 from app.utils.logger import get_logger
@@ -18,14 +27,25 @@ logger = get_logger(__name__)
 class BookingService:
     """Service for managing interview bookings"""
     
-    def __init__(self, config: Config):
+    RESUME_BUCKET = 'resumes'
+    BOOKING_CACHE_SIZE = 1024
+    BOOKING_CACHE_TTL = 60  # Seconds
+    
+    def __init__(self, config: Config, http_client: Optional[httpx.AsyncClient] = None):
         self.config = config
+        # Shared HTTP client for Storage requests (set by the API lifespan so connections are reused)
+        self.http_client = http_client
+        # Postgres connection pool (set by the API lifespan when SUPABASE_DB_URL is configured)
+        self.db_pool: Optional[asyncpg.Pool] = None
+        # Short-lived cache of found bookings, keyed by token (interview pages re-fetch on every reconnect).
+        # The cache is per API worker process, so email_status - the only field updated after creation - is left out.
+        self._booking_cache: TTLCache = TTLCache(maxsize=self.BOOKING_CACHE_SIZE, ttl=self.BOOKING_CACHE_TTL)
         self.supabase: Client = create_client(
             config.supabase.url,
             config.supabase.service_role_key
         )
     
-    def create_booking(
+    async def create_booking(
         self,
         name: str,
         email: str,
@@ -54,56 +74,75 @@ class BookingService:
         # Generate unique token
         token = secrets.token_hex(16)  # 32 characters
         
-        booking_data = {
-            'token': token,
-            'name': name,
-            'email': email,
-            'phone': phone,
-            'scheduled_at': scheduled_at.astimezone(timezone.utc).isoformat() if scheduled_at.tzinfo else scheduled_at.isoformat(),
-            'created_at': datetime.utcnow().isoformat(),
-            'resume_text': resume_text,
-            'resume_url': resume_url,
-        }
+        if scheduled_at.tzinfo:
+            scheduled_at = scheduled_at.astimezone(timezone.utc)
         
         try:
-            result = self.supabase.table('interview_bookings').insert(booking_data).execute()
-            
-            if result.data:
-                logger.info(f"[BookingService] ✅ Created booking for {email} with token {token}")
-                return token
+            if self.db_pool is not None:
+                async with self.db_pool.acquire() as conn:
+                    await conn.execute(
+                        """
+                        INSERT INTO interview_bookings
+                            (token, name, email, phone, scheduled_at, created_at, resume_text, resume_url)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                        """,
+                        token, name, email, phone, scheduled_at,
+                        datetime.now(timezone.utc), resume_text, resume_url,
+                    )
             else:
-                raise AgentError("Failed to create booking: No data returned", "booking")
+                booking_data = {
+                    'token': token,
+                    'name': name,
+                    'email': email,
+                    'phone': phone,
+                    'scheduled_at': scheduled_at.isoformat(),
+                    'created_at': datetime.utcnow().isoformat(),
+                    'resume_text': resume_text,
+                    'resume_url': resume_url,
+                }
+                await asyncio.to_thread(self._insert_booking_rest, booking_data)
+            
+            logger.info(f"[BookingService] ✅ Created booking for {email} with token {token}")
+            return token
                 
         except Exception as e:
             error_msg = f"Failed to create booking: {str(e)}"
             logger.error(f"[BookingService] {error_msg}", exc_info=True)
             raise AgentError(error_msg, "booking")
     
-    def get_booking(self, token: str) -> Optional[Dict[str, Any]]:
+    async def get_booking(self, token: str) -> Optional[Dict[str, Any]]:
         """
         Get booking by token.
         
+        The booking may come from a short-lived cache and never includes
+        email_status; use get_email_status() for the current value.
+        
         Args:
             token: Booking token
             
         Returns:
-            Booking data dict or None if not found
+            Booking data dict (without email_status) or None if not found
         """
+        booking = self._booking_cache.get(token)
+        if booking is not None:
+            return booking
+        
         try:
-            result = self.supabase.table('interview_bookings')\
-                .select('*')\
-                .eq('token', token)\
-                .maybe_single()\
-                .execute()
-            
-            # maybe_single() returns None if no record found
-            if result is None:
-                logger.info(f"[BookingService] No booking found for token {token}")
-                return None
+            if self.db_pool is not None:
+                async with self.db_pool.acquire() as conn:
+                    row = await conn.fetchrow(
+                        "SELECT * FROM interview_bookings WHERE token = $1",
+                        token,
+                    )
+                booking = self._row_to_booking(row) if row else None
+            else:
+                booking = await asyncio.to_thread(self._fetch_booking_rest, token)
             
-            if result.data:
+            if booking:
                 logger.info(f"[BookingService] Found booking for token {token}")
-                return result.data
+                booking.pop('email_status', None)
+                self._booking_cache[token] = booking
+                return booking
             else:
                 logger.info(f"[BookingService] No booking found for token {token}")
                 return None
@@ -112,13 +151,118 @@ class BookingService:
             logger.error(f"[BookingService] Error fetching booking: {str(e)}", exc_info=True)
             return None
     
-    def upload_resume_to_storage(self, file_content: bytes, filename: str) -> str:
+    async def get_email_status(self, token: str) -> Optional[str]:
+        """
+        Get the recorded confirmation email outcome of a booking.
+        
+        Args:
+            token: Booking token
+            
+        Returns:
+            Email delivery status ('sent' or 'failed'), or None if not recorded
+        """
+        try:
+            if self.db_pool is not None:
+                async with self.db_pool.acquire() as conn:
+                    return await conn.fetchval(
+                        "SELECT email_status FROM interview_bookings WHERE token = $1",
+                        token,
+                    )
+            return await asyncio.to_thread(self._fetch_email_status_rest, token)
+            
+        except Exception as e:
+            logger.warning(f"[BookingService] Failed to fetch email status for token {token}: {str(e)}")
+            return None
+    
+    async def update_email_status(self, token: str, email_status: str) -> bool:
+        """
+        Record the confirmation email outcome on a booking.
+        
+        Args:
+            token: Booking token
+            email_status: Email delivery status ('sent' or 'failed')
+            
+        Returns:
+            True if the booking was updated, False otherwise
+        """
+        try:
+            if self.db_pool is not None:
+                async with self.db_pool.acquire() as conn:
+                    await conn.execute(
+                        "UPDATE interview_bookings SET email_status = $1 WHERE token = $2",
+                        email_status, token,
+                    )
+            else:
+                await asyncio.to_thread(self._update_booking_rest, token, {'email_status': email_status})
+            
+            logger.info(f"[BookingService] Recorded email status '{email_status}' for token {token}")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"[BookingService] Failed to record email status for token {token}: {str(e)}")
+            return False
+    
+    def _insert_booking_rest(self, booking_data: Dict[str, Any]) -> None:
+        """Insert booking through the Supabase REST API (blocking - run in a thread)"""
+        result = self.supabase.table('interview_bookings').insert(booking_data).execute()
+        
+        if not result.data:
+            raise AgentError("Failed to create booking: No data returned", "booking")
+    
+    def _update_booking_rest(self, token: str, changes: Dict[str, Any]) -> None:
+        """Update booking through the Supabase REST API (blocking - run in a thread)"""
+        self.supabase.table('interview_bookings')\
+            .update(changes)\
+            .eq('token', token)\
+            .execute()
+    
+    def _fetch_booking_rest(self, token: str) -> Optional[Dict[str, Any]]:
+        """Fetch booking through the Supabase REST API (blocking - run in a thread)"""
+        result = self.supabase.table('interview_bookings')\
+            .select('*')\
+            .eq('token', token)\
+            .maybe_single()\
+            .execute()
+        
+        # maybe_single() returns None if no record found
+        if result is None:
+            return None
+        
+        return result.data or None
+    
+    def _fetch_email_status_rest(self, token: str) -> Optional[str]:
+        """Fetch email status through the Supabase REST API (blocking - run in a thread)"""
+        result = self.supabase.table('interview_bookings')\
+            .select('email_status')\
+            .eq('token', token)\
+            .maybe_single()\
+            .execute()
+        
+        if result is None or not result.data:
+            return None
+        
+        return result.data.get('email_status')
+    
+    def _row_to_booking(self, row: asyncpg.Record) -> Dict[str, Any]:
+        """Convert a database row to a booking dict"""
+        return dict(row.items())
+    
+    async def upload_resume_to_storage_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        content_length: Optional[int] = None,
+    ) -> str:
         """
-        Upload resume file to Supabase Storage.
+        Stream resume file to Supabase Storage without buffering it in memory.
+        
+        Uses the Storage REST endpoint directly, since the Supabase client
+        only accepts complete file contents.
         
         Args:
-            file_content: File content as bytes
+            chunks: Async iterable over the file content
             filename: Original filename
+            content_length: Total file size in bytes, if known
             
         Returns:
             Public URL of uploaded file
@@ -126,43 +270,61 @@ class BookingService:
         Raises:
             AgentError: If upload fails
         """
-        # Generate unique filename
-        from pathlib import Path
-        import time
-        import random
-        import string
-        
-        file_ext = Path(filename).suffix
-        unique_filename = f"{int(time.time())}_{''.join(random.choices(string.ascii_lowercase + string.digits, k=7))}{file_ext}"
+        unique_filename = self._generate_storage_filename(filename)
+        service_role_key = self.config.supabase.service_role_key
+        upload_url = (
+            f"{self.config.supabase.url.rstrip('/')}/storage/v1/object/"
+            f"{self.RESUME_BUCKET}/{unique_filename}"
+        )
+        headers = {
+            'Authorization': f"Bearer {service_role_key}",
+            'apikey': service_role_key,
+            'Content-Type': 'application/octet-stream',
+            'x-upsert': 'false',
+        }
+        # Send a fixed length body instead of chunked transfer encoding when the size is known
+        if content_length is not None:
+            headers['Content-Length'] = str(content_length)
         
         try:
-            # Upload to Supabase Storage
-            response = self.supabase.storage.from_('resumes').upload(
-                unique_filename,
-                file_content,
-                file_options={'content-type': 'application/octet-stream'}
-            )
-            
-            if response:
-                # Get public URL - Supabase Python client returns URL directly
-                public_url_response = self.supabase.storage.from_('resumes').get_public_url(unique_filename)
-                # The response is a dictionary with the URL
-                if isinstance(public_url_response, dict):
-                    public_url = public_url_response.get('publicUrl') or public_url_response.get('public_url')
-                else:
-                    public_url = str(public_url_response)
-                
-                if not public_url:
-                    # Fallback: construct URL manually
-                    public_url = f"{self.config.supabase.url}/storage/v1/object/public/resumes/{unique_filename}"
-                
-                logger.info(f"[BookingService] ✅ Uploaded resume: {unique_filename}")
-                return public_url
+            if self.http_client is not None:
+                response = await self.http_client.post(upload_url, content=chunks, headers=headers)
             else:
-                raise AgentError("Failed to upload resume: No response", "storage")
-                
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.post(upload_url, content=chunks, headers=headers)
+            
+            if response.is_error:
+                raise AgentError(
+                    f"Failed to upload resume: HTTP {response.status_code} {response.text[:200]}",
+                    "storage"
+                )
+            
+            public_url = self._get_public_url(unique_filename)
+            logger.info(f"[BookingService] ✅ Uploaded resume: {unique_filename}")
+            return public_url
+            
         except Exception as e:
             error_msg = f"Failed to upload resume to storage: {str(e)}"
             logger.error(f"[BookingService] {error_msg}", exc_info=True)
             raise AgentError(error_msg, "storage")
-
+    
+    def _generate_storage_filename(self, filename: str) -> str:
+        """Generate a unique storage object name keeping the original extension"""
+        file_ext = Path(filename).suffix
+        return f"{int(time.time())}_{''.join(random.choices(string.ascii_lowercase + string.digits, k=7))}{file_ext}"
+    
+    def _get_public_url(self, unique_filename: str) -> str:
+        """Get public URL of an uploaded resume"""
+        # Get public URL - Supabase Python client returns URL directly
+        public_url_response = self.supabase.storage.from_(self.RESUME_BUCKET).get_public_url(unique_filename)
+        # The response is a dictionary with the URL
+        if isinstance(public_url_response, dict):
+            public_url = public_url_response.get('publicUrl') or public_url_response.get('public_url')
+        else:
+            public_url = str(public_url_response)
+        
+        if not public_url:
+            # Fallback: construct URL manually
+            public_url = f"{self.config.supabase.url}/storage/v1/object/public/{self.RESUME_BUCKET}/{unique_filename}"
+        
+        return public_url
@@ -4,6 +4,7 @@ Email Service
 Handles sending interview confirmation emails via SMTP.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Optional, Tuple
 import aiosmtplib
@@ -26,6 +27,9 @@ class EmailService:
             config.smtp.user and
             config.smtp.password
         )
+        # Cached SMTP connection, reused across emails to skip the TLS and login handshake
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._smtp_lock = asyncio.Lock()
     
     async def send_interview_email(
         self,
@@ -69,22 +73,16 @@ class EmailService:
             html_part = MIMEText(html_content, "html")
             message.attach(html_part)
             
-            # Send email
-            # For port 587: use STARTTLS (connect plain, then upgrade to TLS)
-            # For port 465: use direct TLS/SSL connection
-            # SMTP_SECURE=true means use direct TLS (port 465), false means use STARTTLS (port 587)
-            use_tls = self.config.smtp.secure  # Direct TLS for port 465
-            start_tls = not self.config.smtp.secure  # STARTTLS for port 587
-            
-            await aiosmtplib.send(
-                message,
-                hostname=self.config.smtp.host,
-                port=self.config.smtp.port,
-                use_tls=use_tls,
-                start_tls=start_tls,
-                username=self.config.smtp.user,
-                password=self.config.smtp.password,
-            )
+            # Send email over the cached connection
+            async with self._smtp_lock:
+                smtp = await self._get_smtp()
+                try:
+                    await smtp.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Connection dropped after the health check - retry once on a fresh one
+                    self._smtp = None
+                    smtp = await self._get_smtp()
+                    await smtp.send_message(message)
             
             logger.info(f"[EmailService] ✅ Email sent successfully to {to_email}")
             return True, None
@@ -94,6 +92,57 @@ class EmailService:
             logger.error(f"[EmailService] {error_msg}", exc_info=True)
             return False, error_msg
     
+    async def close(self) -> None:
+        """Close the cached SMTP connection"""
+        async with self._smtp_lock:
+            await self._close_smtp()
+    
+    async def _get_smtp(self) -> aiosmtplib.SMTP:
+        """
+        Get the cached SMTP connection, connecting if needed.
+        
+        The cached connection is health-checked with NOOP and replaced
+        if the server has closed it.
+        
+        Returns:
+            Connected and authenticated SMTP client
+        """
+        if self._smtp is not None and self._smtp.is_connected:
+            try:
+                await self._smtp.noop()
+                return self._smtp
+            except aiosmtplib.SMTPException:
+                logger.info("[EmailService] Cached SMTP connection is stale - reconnecting")
+                await self._close_smtp()
+        
+        # For port 587: use STARTTLS (connect plain, then upgrade to TLS)
+        # For port 465: use direct TLS/SSL connection
+        # SMTP_SECURE=true means use direct TLS (port 465), false means use STARTTLS (port 587)
+        use_tls = self.config.smtp.secure  # Direct TLS for port 465
+        start_tls = not self.config.smtp.secure  # STARTTLS for port 587
+        
+        smtp = aiosmtplib.SMTP(
+            hostname=self.config.smtp.host,
+            port=self.config.smtp.port,
+            use_tls=use_tls,
+            start_tls=start_tls,
+            username=self.config.smtp.user,
+            password=self.config.smtp.password,
+        )
+        await smtp.connect()
+        self._smtp = smtp
+        return smtp
+    
+    async def _close_smtp(self) -> None:
+        """Close and forget the cached SMTP connection"""
+        smtp, self._smtp = self._smtp, None
+        if smtp is None or not smtp.is_connected:
+            return
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+    
     def _create_email_html(self, name: str, interview_url: str, formatted_date: str, formatted_time: str) -> str:
         """Create HTML email content"""
         return f"""
@@ -5,26 +5,39 @@ Handles resume file upload, text extraction, and storage.
 """
 
 import re
+import zipfile
 from io import BytesIO
-from typing import Optional, Tuple
+from typing import AsyncIterator, BinaryIO, List, Optional, Tuple, Union
 from pathlib import Path
+from xml.etree import ElementTree
+
+from cachetools import LRUCache
 
 try:
-    from PyPDF2 import PdfReader
+    import pymupdf
 except ImportError:
-    PdfReader = None
+    pymupdf = None
 
 try:
-    from docx import Document
+    from PyPDF2 import PdfReader
 except ImportError:
-    Document = None
+    PdfReader = None
 
 from app.config import Config
 from app.utils.logger import get_logger
-from app.utils.exceptions import AgentError
+from app.utils.exceptions import AgentError, FileTooLargeError, ValidationError
 
 logger = get_logger(__name__)
 
+# WordprocessingML elements read from word/document.xml
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_PARAGRAPH = f'{_W_NS}p'
+_W_TEXT = f'{_W_NS}t'
+_W_TAB = f'{_W_NS}tab'
+_W_BREAKS = {f'{_W_NS}br', f'{_W_NS}cr'}
+# Fallback copy of alternate content (e.g. a VML duplicate of a text box)
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
 
 class ResumeService:
     """Service for processing resume files"""
@@ -36,26 +49,88 @@ class ResumeService:
         'application/msword',
         'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
     }
+    # Leading bytes of PDF, DOCX (zip) and legacy DOC (OLE2) files
+    MAGIC_NUMBERS = (b'%PDF-', b'PK\x03\x04', b'\xd0\xcf\x11\xe0')
+    EXTRACTION_CACHE_SIZE = 512
     
     def __init__(self, config: Config):
         self.config = config
+        # Extraction results keyed by content hash, so re-uploads of the same file skip extraction
+        self._extraction_cache: LRUCache = LRUCache(maxsize=self.EXTRACTION_CACHE_SIZE)
         
-    def validate_file(self, file_content: bytes, filename: str, content_type: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+    async def validate_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        content_type: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
         """
-        Validate resume file.
+        Validate resume file incrementally while passing its chunks through.
+        
+        The file type is checked up front, the first chunk is checked for a
+        known file signature and the running size is checked on every chunk,
+        so oversized or mislabelled uploads are rejected without buffering them.
         
         Args:
-            file_content: File content as bytes
+            chunks: Async iterator over the file content
             filename: Original filename
             content_type: MIME type of file
             
+        Yields:
+            File content chunks, unchanged
+            
+        Raises:
+            FileTooLargeError: If the file exceeds the size limit
+            ValidationError: If the file fails validation
+        """
+        is_valid, error_msg = self._validate_file_type(filename, content_type)
+        if not is_valid:
+            raise ValidationError(error_msg, "file")
+        
+        total_size = 0
+        async for chunk in chunks:
+            if total_size == 0 and not chunk.startswith(self.MAGIC_NUMBERS):
+                raise ValidationError("File content does not match a PDF or DOC/DOCX file", "file")
+            
+            total_size += len(chunk)
+            if total_size > self.MAX_FILE_SIZE:
+                raise FileTooLargeError(self._size_error(), "file")
+            
+            yield chunk
+        
+        if total_size == 0:
+            raise ValidationError("File is empty", "file")
+    
+    def get_cached_extraction(self, content_hash: str, filename: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Get a previous extraction result for identical file content.
+        
+        Args:
+            content_hash: Hex digest of the file content
+            filename: Original filename
+            
         Returns:
-            Tuple of (is_valid, error_message)
+            Tuple of (extracted_text, error_message), or None if not cached
+        """
+        return self._extraction_cache.get((content_hash, Path(filename).suffix.lower()))
+    
+    def cache_extraction(self, content_hash: str, filename: str, result: Tuple[str, Optional[str]]) -> None:
         """
-        # Check file size
-        if len(file_content) > self.MAX_FILE_SIZE:
-            return False, f"File size exceeds maximum of {self.MAX_FILE_SIZE / 1024 / 1024}MB"
+        Store an extraction result for the file content.
         
+        Args:
+            content_hash: Hex digest of the file content
+            filename: Original filename
+            result: Tuple of (extracted_text, error_message)
+        """
+        self._extraction_cache[(content_hash, Path(filename).suffix.lower())] = result
+    
+    def _size_error(self) -> str:
+        """Error message for files over the size limit"""
+        return f"File size exceeds maximum of {self.MAX_FILE_SIZE / 1024 / 1024}MB"
+    
+    def _validate_file_type(self, filename: str, content_type: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """Validate file extension and MIME type"""
         # Check extension
         file_ext = Path(filename).suffix.lower()
         if file_ext not in self.ALLOWED_EXTENSIONS:
@@ -67,12 +142,13 @@ class ResumeService:
         
         return True, None
     
-    def extract_text(self, file_content: bytes, filename: str, content_type: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    @classmethod
+    def extract_text(cls, file_content: Union[bytes, BinaryIO], filename: str, content_type: Optional[str] = None) -> Tuple[str, Optional[str]]:
         """
         Extract text from resume file.
         
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes or a readable binary file object
             filename: Original filename
             content_type: MIME type of file
             
@@ -83,9 +159,9 @@ class ResumeService:
         
         try:
             if file_ext == '.pdf':
-                return self._extract_pdf_text(file_content)
+                return cls._extract_pdf_text(file_content)
             elif file_ext in ['.doc', '.docx']:
-                return self._extract_docx_text(file_content)
+                return cls._extract_docx_text(file_content)
             else:
                 return "", f"Unsupported file type: {file_ext}"
         except Exception as e:
@@ -93,22 +169,18 @@ class ResumeService:
             logger.error(f"[ResumeService] {error_msg}", exc_info=True)
             return "", error_msg
     
-    def _extract_pdf_text(self, file_content: bytes) -> Tuple[str, Optional[str]]:
+    @classmethod
+    def _extract_pdf_text(cls, file_content: Union[bytes, BinaryIO]) -> Tuple[str, Optional[str]]:
         """Extract text from PDF file"""
-        if PdfReader is None:
-            return "", "PyPDF2 library not installed"
+        if pymupdf is None and PdfReader is None:
+            return "", "No PDF library installed (PyMuPDF or PyPDF2)"
         
         try:
-            pdf_file = BytesIO(file_content)
-            reader = PdfReader(pdf_file)
-            
-            text_parts = []
-            num_pages = len(reader.pages)
-            
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
+            # PyMuPDF parses in C and is much faster; PyPDF2 is kept as a fallback
+            if pymupdf is not None:
+                text_parts, num_pages = cls._read_pdf_pymupdf(file_content)
+            else:
+                text_parts, num_pages = cls._read_pdf_pypdf2(file_content)
             
             full_text = '\n'.join(text_parts)
             
@@ -116,7 +188,7 @@ class ResumeService:
                 return "", "PDF appears to be image-based (scanned) - no text content found"
             
             # Clean text
-            cleaned_text = self._clean_text(full_text)
+            cleaned_text = cls._clean_text(full_text)
             
             logger.info(f"[ResumeService] ✅ PDF extraction complete: {len(cleaned_text)} characters from {num_pages} page(s)")
             
@@ -130,19 +202,33 @@ class ResumeService:
             logger.error(f"[ResumeService] {error_msg}", exc_info=True)
             return "", error_msg
     
-    def _extract_docx_text(self, file_content: bytes) -> Tuple[str, Optional[str]]:
-        """Extract text from DOC/DOCX file"""
-        if Document is None:
-            return "", "python-docx library not installed"
+    @classmethod
+    def _read_pdf_pymupdf(cls, file_content: Union[bytes, BinaryIO]) -> Tuple[List[str], int]:
+        """Read page texts from PDF file with PyMuPDF"""
+        data = file_content if isinstance(file_content, (bytes, bytearray)) else file_content.read()
         
+        with pymupdf.open(stream=data, filetype="pdf") as doc:
+            text_parts = [text for text in (page.get_text("text") for page in doc) if text]
+            return text_parts, doc.page_count
+    
+    @classmethod
+    def _read_pdf_pypdf2(cls, file_content: Union[bytes, BinaryIO]) -> Tuple[List[str], int]:
+        """Read page texts from PDF file with PyPDF2"""
+        reader = PdfReader(cls._as_stream(file_content))
+        
+        text_parts = []
+        for page in reader.pages:
+            text = page.extract_text()
+            if text:
+                text_parts.append(text)
+        
+        return text_parts, len(reader.pages)
+    
+    @classmethod
+    def _extract_docx_text(cls, file_content: Union[bytes, BinaryIO]) -> Tuple[str, Optional[str]]:
+        """Extract text from DOC/DOCX file"""
         try:
-            doc_file = BytesIO(file_content)
-            doc = Document(doc_file)
-            
-            text_parts = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_parts.append(paragraph.text)
+            text_parts = cls._read_docx_paragraphs(cls._as_stream(file_content))
             
             full_text = '\n'.join(text_parts)
             
@@ -150,7 +236,7 @@ class ResumeService:
                 return "", "Document appears to be empty"
             
             # Clean text
-            cleaned_text = self._clean_text(full_text)
+            cleaned_text = cls._clean_text(full_text)
             
             logger.info(f"[ResumeService] ✅ DOCX extraction complete: {len(cleaned_text)} characters")
             
@@ -164,7 +250,56 @@ class ResumeService:
             logger.error(f"[ResumeService] {error_msg}", exc_info=True)
             return "", error_msg
     
-    def _clean_text(self, text: str) -> str:
+    @classmethod
+    def _read_docx_paragraphs(cls, doc_file: BinaryIO) -> List[str]:
+        """
+        Read non-empty paragraphs from a DOCX file.
+        
+        Streams word/document.xml with iterparse and discards each paragraph
+        once read, instead of building the full document tree. Paragraphs
+        nested in text boxes are read separately from the paragraph holding
+        them, and the fallback copy of alternate content is skipped so text
+        boxes are not read twice.
+        """
+        text_parts = []
+        paragraph_runs: List[List[str]] = []  # Runs of each open paragraph, innermost last
+        fallback_depth = 0
+        
+        with zipfile.ZipFile(doc_file) as archive, archive.open('word/document.xml') as document_xml:
+            for event, element in ElementTree.iterparse(document_xml, events=('start', 'end')):
+                if element.tag == _MC_FALLBACK:
+                    fallback_depth += 1 if event == 'start' else -1
+                    continue
+                if fallback_depth:
+                    continue
+                
+                if element.tag == _W_PARAGRAPH:
+                    if event == 'start':
+                        paragraph_runs.append([])
+                    else:
+                        paragraph = ''.join(paragraph_runs.pop())
+                        if paragraph.strip():
+                            text_parts.append(paragraph)
+                        element.clear()
+                elif event == 'end' and paragraph_runs:
+                    if element.tag == _W_TEXT:
+                        paragraph_runs[-1].append(element.text or '')
+                    elif element.tag == _W_TAB:
+                        paragraph_runs[-1].append('\t')
+                    elif element.tag in _W_BREAKS:
+                        paragraph_runs[-1].append('\n')
+        
+        return text_parts
+    
+    @classmethod
+    def _as_stream(cls, file_content: Union[bytes, BinaryIO]) -> BinaryIO:
+        """Wrap raw bytes in a file object; pass file objects through"""
+        if isinstance(file_content, (bytes, bytearray)):
+            return BytesIO(file_content)
+        return file_content
+    
+    @classmethod
+    def _clean_text(cls, text: str) -> str:
         """Clean and normalize extracted text"""
         # Remove extra whitespace
         text = re.sub(r'\s+', ' ', text)
@@ -175,3 +310,19 @@ class ResumeService:
         
         return text
 
+
+def extract_text_bytes(file_content: bytes, filename: str, content_type: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """
+    Extract text from resume file content.
+    
+    Top-level function so it can be pickled and run in a process pool.
+    
+    Args:
+        file_content: File content as bytes
+        filename: Original filename
+        content_type: MIME type of file
+        
+    Returns:
+        Tuple of (extracted_text, error_message)
+    """
+    return ResumeService.extract_text(file_content, filename, content_type)
@@ -49,6 +49,14 @@ class ValidationError(ApplicationError):
         super().__init__(message, error_code, 400)
 
 
+class FileTooLargeError(ValidationError):
+    """Uploaded file exceeds the size limit"""
+    
+    def __init__(self, message: str, field: Optional[str] = None):
+        super().__init__(message, field)
+        self.status_code = 413
+
+
 class ServiceError(ApplicationError):
     """Service layer errors"""
     
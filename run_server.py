@@ -16,11 +16,17 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", config.server.port))
     host = os.environ.get("HOST", config.server.host)
     
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]), falling back to asyncio/h11
     uvicorn.run(
         "app.api.main:app",
         host=host,
         port=port,
         reload=False,  # Disable reload for production
-        log_level="info",
+        workers=config.server.workers,  # WEB_CONCURRENCY, default 2
+        loop="auto",
+        http="auto",
+        log_level="warning",
+        access_log=False,  # Skip per-request access log formatting
+        proxy_headers=True,
     )
 
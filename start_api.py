@@ -5,6 +5,7 @@ Handles PORT environment variable correctly.
 """
 import os
 import uvicorn
+from app.config import get_config
 
 if __name__ == "__main__":
     # Get port from environment variable, default to 8000 if not set
@@ -12,9 +13,15 @@ if __name__ == "__main__":
     host = os.environ.get("HOST", "0.0.0.0")
     
     # Start the FastAPI application
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]), falling back to asyncio/h11
     uvicorn.run(
         "app.api.main:app",
         host=host,
         port=port,
-        log_level="info"
+        workers=get_config().server.workers,  # WEB_CONCURRENCY, default 2
+        loop="auto",
+        http="auto",
+        log_level="warning",
+        access_log=False,  # Skip per-request access log formatting
+        proxy_headers=True,
     )